@@ -0,0 +1,156 @@
+#include "demoph/demoph.h"
+#include "core/transform_simd.hpp"
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/string.h>
+
+#include <cstdint>
+#include <mutex>
+#include <stdexcept>
+#include <unordered_map>
+
+namespace nb = nanobind;
+
+namespace {
+
+Demoph::Scene* GetOrCreateActiveScene(Demoph::Engine& engine) {
+    Demoph::Scene* scene = engine.GetActiveScene();
+    if (!scene) {
+        scene = engine.CreateScene("Default");
+    }
+    return scene;
+}
+
+using TransformBuffer = nb::ndarray<float, nb::shape<9, -1>, nb::c_contig, nb::device::cpu>;
+using VelocityBuffer = nb::ndarray<const float, nb::shape<3, -1>, nb::c_contig, nb::device::cpu>;
+
+void UpdateTransforms(TransformBuffer transforms, VelocityBuffer velocities, float deltaTime) {
+    const size_t count = transforms.shape(1);
+    if (velocities.shape(1) != count) {
+        throw std::invalid_argument("transforms and velocities must hold the same number of entities");
+    }
+
+    // The position rows (x, y, z) are the first 3 * count floats of the buffer
+    Demoph::UpdatePositions(transforms.data(), velocities.data(), deltaTime, 3 * count);
+}
+
+// Serializes engine updates, shutdown and entity creation/destruction
+// across Python threads (the engine is a singleton, so one mutex suffices).
+// Recursive because scripts run by Engine::Update may call back into here
+std::recursive_mutex g_engineMutex;
+
+// Never block on the mutex while holding the GIL: its owner may be waiting
+// for the GIL (e.g. a frame running Python scripts), so only drop the GIL
+// when the lock is actually contended
+std::unique_lock<std::recursive_mutex> LockEngine() {
+    std::unique_lock<std::recursive_mutex> lock(g_engineMutex, std::try_to_lock);
+    if (!lock.owns_lock()) {
+        nb::gil_scoped_release release;
+        lock.lock();
+    }
+    return lock;
+}
+
+void RunFrames(Demoph::Engine& engine, int frameCount, float deltaTime) {
+    auto lock = LockEngine();
+
+    // Engine::Update re-enters Python through the embedded scripting engine,
+    // which does not take the GIL itself, so the GIL is only dropped for
+    // engines initialized with EngineConfig.enable_scripting = False
+    if (engine.GetScripting()) {
+        for (int i = 0; i < frameCount; ++i) {
+            engine.Update(deltaTime);
+        }
+        return;
+    }
+
+    nb::gil_scoped_release release;
+    for (int i = 0; i < frameCount; ++i) {
+        engine.Update(deltaTime);
+    }
+}
+
+// Entities are handed to Python as opaque ids rather than wrapped pointers,
+// so an id kept past destroy_entity/shutdown can never reach freed memory
+std::unordered_map<uint32_t, Demoph::Entity*> g_entities;
+
+void ShutdownEngine(Demoph::Engine& engine) {
+    // Keeps the GIL: shutting down the scripting engine runs Python
+    auto lock = LockEngine();
+    engine.Shutdown();
+    g_entities.clear();
+}
+
+uint32_t CreateEntity(Demoph::Engine& engine, const std::string& name) {
+    auto lock = LockEngine();
+    const Demoph::EngineState state = engine.GetState();
+    if (state == Demoph::EngineState::Shutting_Down || state == Demoph::EngineState::Shutdown) {
+        throw std::runtime_error("cannot create entities after the engine has shut down");
+    }
+
+    Demoph::Entity* entity = GetOrCreateActiveScene(engine)->CreateEntity(name);
+    g_entities[entity->GetID()] = entity;
+    return entity->GetID();
+}
+
+void DestroyEntity(Demoph::Engine& engine, uint32_t entityId) {
+    auto lock = LockEngine();
+    auto it = g_entities.find(entityId);
+    if (it == g_entities.end()) {
+        return;
+    }
+
+    if (Demoph::Scene* scene = engine.GetActiveScene()) {
+        scene->DestroyEntity(it->second);
+    }
+    g_entities.erase(it);
+}
+
+} // namespace
+
+NB_MODULE(_demoph, m) {
+    m.doc() = "Demoph Engine native Python bindings";
+
+    // transforms is updated in place, so an implicitly converted copy
+    // (float64, non-contiguous) would silently drop the result
+    m.def("update_transforms", &UpdateTransforms,
+          nb::arg("transforms").noconvert(), nb::arg("velocities"), nb::arg("delta_time"));
+
+    nb::class_<Demoph::EngineConfig>(m, "EngineConfig")
+        .def(nb::init<>())
+        .def_rw("window_title", &Demoph::EngineConfig::windowTitle)
+        .def_rw("window_width", &Demoph::EngineConfig::windowWidth)
+        .def_rw("window_height", &Demoph::EngineConfig::windowHeight)
+        .def_rw("window_fullscreen", &Demoph::EngineConfig::windowFullscreen)
+        .def_rw("window_vsync", &Demoph::EngineConfig::windowVSync)
+        .def_rw("window_resizable", &Demoph::EngineConfig::windowResizable)
+        .def_rw("graphics_api", &Demoph::EngineConfig::graphicsAPI)
+        .def_rw("msaa_samples", &Demoph::EngineConfig::msaaSamples)
+        .def_rw("enable_vsync", &Demoph::EngineConfig::enableVSync)
+        .def_rw("enable_physics", &Demoph::EngineConfig::enablePhysics)
+        .def_rw("physics_time_step", &Demoph::EngineConfig::physicsTimeStep)
+        .def_rw("enable_audio", &Demoph::EngineConfig::enableAudio)
+        .def_rw("master_volume", &Demoph::EngineConfig::masterVolume)
+        .def_rw("enable_scripting", &Demoph::EngineConfig::enableScripting)
+        .def_rw("scripting_language", &Demoph::EngineConfig::scriptingLanguage)
+        .def_rw("assets_path", &Demoph::EngineConfig::assetsPath)
+        .def_rw("shaders_path", &Demoph::EngineConfig::shadersPath)
+        .def_rw("config_path", &Demoph::EngineConfig::configPath)
+        .def_rw("enable_imgui", &Demoph::EngineConfig::enableImGui)
+        .def_rw("enable_profiler", &Demoph::EngineConfig::enableProfiler)
+        .def_rw("enable_logging", &Demoph::EngineConfig::enableLogging);
+
+    nb::class_<Demoph::Engine>(m, "Engine")
+        .def(nb::init<>())
+        .def("initialize", nb::overload_cast<>(&Demoph::Engine::Initialize))
+        .def("initialize", nb::overload_cast<const Demoph::EngineConfig&>(&Demoph::Engine::Initialize),
+             nb::arg("config"))
+        .def("update",
+             [](Demoph::Engine& engine, float deltaTime) { RunFrames(engine, 1, deltaTime); },
+             nb::arg("delta_time"))
+        .def("run_frames", &RunFrames, nb::arg("frame_count"), nb::arg("delta_time"))
+        .def("shutdown", &ShutdownEngine)
+        .def("create_entity", &CreateEntity, nb::arg("name") = "Entity")
+        .def("destroy_entity", &DestroyEntity, nb::arg("entity_id"));
+}
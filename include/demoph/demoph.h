@@ -212,8 +212,8 @@ namespace Demoph {
     }
 
     namespace BuildInfo {
-        constexpr const char* Date = __DATE__;
-        constexpr const char* Time = __TIME__;
+        DEMOPH_API extern const char* const Date;
+        DEMOPH_API extern const char* const Time;
         
         #ifdef DEMOPH_PLATFORM_WINDOWS
             constexpr const char* Platform = "Windows";
@@ -5,82 +5,111 @@ Provides Python scripting interface for the engine
 """
 
 import ctypes
-from ctypes import Structure, c_float, c_int, c_bool, c_char_p, POINTER
-from typing import List, Tuple, Optional
+import importlib.util
 import os
+from typing import List, Tuple, Optional
 
-# Load the engine library
-if os.name == 'nt':
-    engine_lib = ctypes.CDLL('./libdemoph.dll')
-else:
-    engine_lib = ctypes.CDLL('./libdemoph.so')
+import numpy as np
 
-class Vector3(Structure):
-    _fields_ = [
-        ("x", c_float),
-        ("y", c_float),
-        ("z", c_float)
-    ]
-    
-    def __init__(self, x=0.0, y=0.0, z=0.0):
-        self.x = x
-        self.y = y
-        self.z = z
+def _preload_bolt_library():
+    """Preload the BOLT-optimized engine library unless it is stale"""
+    spec = importlib.util.find_spec('_demoph')
+    if spec is None or spec.origin is None:
+        return
+    lib_dir = os.path.dirname(spec.origin)
+    bolt_path = os.path.join(lib_dir, 'libdemoph.bolt.so')
+    regular_path = os.path.join(lib_dir, 'libdemoph.so')
+    if not os.path.exists(bolt_path) or not os.path.exists(regular_path):
+        return
+    if os.path.getmtime(bolt_path) >= os.path.getmtime(regular_path):
+        ctypes.CDLL(bolt_path, mode=ctypes.RTLD_GLOBAL)
 
-class Transform(Structure):
-    _fields_ = [
-        ("position", Vector3),
-        ("rotation", Vector3),
-        ("scale", Vector3)
-    ]
+_preload_bolt_library()
 
-# Engine API bindings
-engine_lib.CreateEngine.restype = ctypes.c_void_p
-engine_lib.DestroyEngine.argtypes = [ctypes.c_void_p]
-engine_lib.InitializeEngine.argtypes = [ctypes.c_void_p]
-engine_lib.InitializeEngine.restype = c_bool
-engine_lib.UpdateEngine.argtypes = [ctypes.c_void_p, c_float]
-engine_lib.ShutdownEngine.argtypes = [ctypes.c_void_p]
+import _demoph
 
-# Entity API bindings
-engine_lib.CreateEntity.argtypes = [ctypes.c_void_p, c_char_p]
-engine_lib.CreateEntity.restype = ctypes.c_void_p
-engine_lib.DestroyEntity.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+class TransformArray:
+    """Structure-of-arrays storage for a batch of entity transforms"""
+    
+    def __init__(self, count: int):
+        self.data = np.zeros((9, count), dtype=np.float32)
+        self.data[6:9] = 1.0
+        self.velocity = np.zeros((3, count), dtype=np.float32)
+    
+    def __len__(self) -> int:
+        return self.data.shape[1]
+    
+    @property
+    def position(self) -> np.ndarray:
+        return self.data[0:3]
+    
+    @property
+    def rotation(self) -> np.ndarray:
+        return self.data[3:6]
+    
+    @property
+    def scale(self) -> np.ndarray:
+        return self.data[6:9]
 
 class EngineBinding:
     """Python wrapper for the Demoph Engine"""
     
     def __init__(self):
-        self._engine = engine_lib.CreateEngine()
-        self._entities = []
-    
-    def __del__(self):
-        if hasattr(self, '_engine') and self._engine:
-            engine_lib.DestroyEngine(self._engine)
+        self._engine = _demoph.Engine()
+        self._entities = set()
+        self._systems = []
     
-    def initialize(self) -> bool:
+    def initialize(self, config: Optional['_demoph.EngineConfig'] = None) -> bool:
         """Initialize the engine"""
-        return engine_lib.InitializeEngine(self._engine)
+        if config is None:
+            return self._engine.initialize()
+        return self._engine.initialize(config)
     
     def update(self, delta_time: float):
-        """Update the engine"""
-        engine_lib.UpdateEngine(self._engine, delta_time)
+        """Update the engine and its batch script systems"""
+        self._engine.update(delta_time)
+        self.update_systems(delta_time)
+    
+    def run_frames(self, frame_count: int, delta_time: float):
+        """Run a fixed number of engine updates"""
+        if not self._systems:
+            self._engine.run_frames(frame_count, delta_time)
+            return
+        update = self.update
+        for _ in range(frame_count):
+            update(delta_time)
+    
+    def update_transforms(self, transforms: TransformArray, delta_time: float):
+        """Integrate transform positions by their velocities in one native call"""
+        _demoph.update_transforms(transforms.data, transforms.velocity, delta_time)
+    
+    def add_system(self, system: 'BatchScriptSystem', transforms: TransformArray):
+        """Register a batch script system that updates the given transforms"""
+        self._systems.append((system, transforms))
+        system.start()
+    
+    def update_systems(self, delta_time: float):
+        """Run every enabled batch script system once for this frame"""
+        for system, transforms in self._systems:
+            if system.enabled:
+                system.update_batch(transforms, delta_time)
     
     def shutdown(self):
         """Shutdown the engine"""
-        engine_lib.ShutdownEngine(self._engine)
+        self._engine.shutdown()
+        self._entities.clear()
     
-    def create_entity(self, name: str = "Entity"):
-        """Create a new entity"""
-        entity = engine_lib.CreateEntity(self._engine, name.encode('utf-8'))
-        self._entities.append(entity)
+    def create_entity(self, name: str = "Entity") -> int:
+        """Create a new entity and return its id"""
+        entity = self._engine.create_entity(name)
+        self._entities.add(entity)
         return entity
     
-    def destroy_entity(self, entity):
+    def destroy_entity(self, entity: int):
         """Destroy an entity"""
         if entity in self._entities:
-            engine_lib.DestroyEntity(self._engine, entity)
             self._entities.remove(entity)
+            self._engine.destroy_entity(entity)
 
 class ScriptComponent:
     """Base class for Python script components"""
@@ -105,6 +134,20 @@ class ScriptComponent:
         """Called when collision ends"""
         pass
 
+class BatchScriptSystem:
+    """Base class for Python scripts that update many entities at once"""
+    
+    def __init__(self):
+        self.enabled = True
+    
+    def start(self):
+        """Called when the system is added to the engine"""
+        pass
+    
+    def update_batch(self, transforms: TransformArray, delta_time: float):
+        """Called every frame with the transforms of all entities in the system"""
+        pass
+
 # Utility functions
 def log_info(message: str):
     """Log an info message"""
@@ -129,9 +172,19 @@ if __name__ == "__main__":
         entity = engine.create_entity("TestEntity")
         log_info(f"Created entity: {entity}")
         
+        # Move a batch of transforms with a system updated every frame
+        class MoveSystem(BatchScriptSystem):
+            def update_batch(self, transforms, delta_time):
+                engine.update_transforms(transforms, delta_time)
+        
+        transforms = TransformArray(1000)
+        transforms.velocity[0] = 1.0
+        engine.add_system(MoveSystem(), transforms)
+        
         # Run for a few frames
-        for i in range(60):
-            engine.update(1.0 / 60.0)
+        engine.run_frames(60, 1.0 / 60.0)
+        
+        log_info(f"Moved {len(transforms)} transforms to x={transforms.position[0, 0]:.2f}")
         
         engine.shutdown()
         log_info("Engine shutdown complete")
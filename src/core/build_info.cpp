@@ -0,0 +1,10 @@
+#include "demoph/demoph.h"
+
+namespace Demoph::BuildInfo {
+
+// Kept out of the header so only this translation unit changes on every
+// build and the rest stay cacheable
+const char* const Date = __DATE__;
+const char* const Time = __TIME__;
+
+} // namespace Demoph::BuildInfo
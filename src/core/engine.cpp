@@ -155,6 +155,7 @@ bool Engine::InitializeSubsystems() {
         m_scripting = std::make_unique<ScriptEngine>();
         if (!m_scripting->Initialize(m_config.scriptingLanguage)) {
             DEMOPH_LOG_ERROR("Failed to initialize scripting");
+            m_scripting.reset();
             return false;
         }
     }
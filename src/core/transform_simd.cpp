@@ -0,0 +1,51 @@
+#include "core/transform_simd.hpp"
+
+#if (defined(__GNUC__) || defined(__clang__)) && (defined(__x86_64__) || defined(__i386__))
+    #include <immintrin.h>
+    #define DEMOPH_TRANSFORM_SIMD_AVX2
+#endif
+
+namespace Demoph {
+
+namespace {
+
+void UpdatePositionsScalar(float* positions, const float* velocities, float deltaTime, size_t count) {
+    for (size_t i = 0; i < count; ++i) {
+        positions[i] += velocities[i] * deltaTime;
+    }
+}
+
+#ifdef DEMOPH_TRANSFORM_SIMD_AVX2
+__attribute__((target("avx2,fma")))
+void UpdatePositionsAVX2(float* positions, const float* velocities, float deltaTime, size_t count) {
+    const __m256 dt = _mm256_set1_ps(deltaTime);
+    
+    size_t i = 0;
+    for (; i + 8 <= count; i += 8) {
+        const __m256 position = _mm256_loadu_ps(positions + i);
+        const __m256 velocity = _mm256_loadu_ps(velocities + i);
+        _mm256_storeu_ps(positions + i, _mm256_fmadd_ps(velocity, dt, position));
+    }
+    
+    UpdatePositionsScalar(positions + i, velocities + i, deltaTime, count - i);
+}
+
+bool SupportsAVX2() {
+    static const bool supported = __builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma");
+    return supported;
+}
+#endif
+
+} // namespace
+
+void UpdatePositions(float* positions, const float* velocities, float deltaTime, size_t count) {
+#ifdef DEMOPH_TRANSFORM_SIMD_AVX2
+    if (SupportsAVX2()) {
+        UpdatePositionsAVX2(positions, velocities, deltaTime, count);
+        return;
+    }
+#endif
+    UpdatePositionsScalar(positions, velocities, deltaTime, count);
+}
+
+} // namespace Demoph
@@ -0,0 +1,24 @@
+
+#pragma once
+
+#include "demoph/demoph.h"
+
+#include <cstddef>
+
+namespace Demoph {
+
+/**
+ * @brief Integrate positions by velocities: positions[i] += velocities[i] * deltaTime
+ * 
+ * Operates on flat float buffers (e.g. the position rows of a
+ * structure-of-arrays transform batch). Uses an AVX2/FMA kernel when the
+ * CPU supports it and falls back to a scalar loop otherwise.
+ * 
+ * @param positions Position components, updated in place
+ * @param velocities Velocity components, same length as positions
+ * @param deltaTime Time step in seconds
+ * @param count Number of floats in each buffer
+ */
+DEMOPH_API void UpdatePositions(float* positions, const float* velocities, float deltaTime, size_t count);
+
+} // namespace Demoph
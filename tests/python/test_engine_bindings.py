@@ -0,0 +1,99 @@
+"""Tests for the Python scripting bindings in scripts/engine_bindings.py"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+_demoph = pytest.importorskip("_demoph")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+from engine_bindings import BatchScriptSystem, EngineBinding, TransformArray
+
+
+class DriftSystem(BatchScriptSystem):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def update_batch(self, transforms, delta_time):
+        self.calls += 1
+        transforms.position[0] += delta_time
+
+
+def test_update_runs_batch_systems_once_per_frame():
+    engine = EngineBinding()
+    transforms = TransformArray(4)
+    system = DriftSystem()
+    engine.add_system(system, transforms)
+
+    engine.update(0.5)
+
+    assert system.calls == 1
+    np.testing.assert_allclose(transforms.position[0], 0.5)
+    np.testing.assert_allclose(transforms.position[1:], 0.0)
+
+
+def test_run_frames_updates_systems_every_frame():
+    engine = EngineBinding()
+    transforms = TransformArray(4)
+    system = DriftSystem()
+    engine.add_system(system, transforms)
+
+    engine.run_frames(3, 0.5)
+
+    assert system.calls == 3
+    np.testing.assert_allclose(transforms.position[0], 1.5)
+
+
+def test_disabled_system_is_skipped():
+    engine = EngineBinding()
+    transforms = TransformArray(4)
+    system = DriftSystem()
+    system.enabled = False
+    engine.add_system(system, transforms)
+
+    engine.update(0.5)
+
+    assert system.calls == 0
+    np.testing.assert_allclose(transforms.position, 0.0)
+
+
+@pytest.mark.parametrize("count", [3, 13])
+def test_update_transforms_handles_scalar_tail(count):
+    engine = EngineBinding()
+    transforms = TransformArray(count)
+    transforms.velocity[:] = np.arange(3 * count, dtype=np.float32).reshape(3, count)
+
+    engine.update_transforms(transforms, 0.5)
+
+    np.testing.assert_allclose(transforms.position, transforms.velocity * 0.5)
+    np.testing.assert_allclose(transforms.rotation, 0.0)
+    np.testing.assert_allclose(transforms.scale, 1.0)
+
+
+def test_update_transforms_rejects_count_mismatch():
+    transforms = TransformArray(8)
+    velocities = np.zeros((3, 9), dtype=np.float32)
+
+    with pytest.raises(ValueError):
+        _demoph.update_transforms(transforms.data, velocities, 0.5)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        np.zeros((9, 8), dtype=np.float64),
+        np.zeros((9, 16), dtype=np.float32)[:, ::2],
+    ],
+    ids=["float64", "non-contiguous"],
+)
+def test_update_transforms_rejects_buffers_it_cannot_update_in_place(data):
+    velocities = np.ones((3, 8), dtype=np.float32)
+
+    with pytest.raises(TypeError):
+        _demoph.update_transforms(data, velocities, 0.5)
+
+    np.testing.assert_allclose(data, 0.0)